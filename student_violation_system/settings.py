@@ -360,6 +360,14 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Authentication model & redirects
 AUTH_USER_MODEL = "violations.User"
 
+# ModelBackend that also loads request.user.student_profile in the session user query.
+# The stock ModelBackend stays listed so sessions created before the switch (which
+# record it as their backend) remain valid.
+AUTHENTICATION_BACKENDS = [
+    "violations.backends.StudentProfileBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
 # These reverse names assume the app is included with namespace 'violations'
 LOGIN_URL = 'violations:auth_login'
 LOGIN_REDIRECT_URL = 'violations:staff_dashboard'
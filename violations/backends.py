@@ -0,0 +1,19 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class StudentProfileBackend(ModelBackend):
+    """ModelBackend that loads the user's student profile in the same query.
+
+    Student views read ``request.user.student_profile`` on nearly every request;
+    joining it here saves the extra reverse one-to-one lookup. For non-student
+    users the join simply finds no profile.
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related("student_profile").get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("violations", "0028_remove_staffverification"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(
+                fields=["student", "-created_at"], name="viol_student_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(fields=["status"], name="viol_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(fields=["type"], name="viol_type_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(fields=["incident_at"], name="viol_incident_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(
+                fields=["status", "incident_at"], name="viol_status_incident_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="apologyletter",
+            index=models.Index(fields=["status"], name="apology_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="apologyletter",
+            index=models.Index(
+                fields=["formator_status"], name="apology_formator_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="apologyletter",
+            index=models.Index(fields=["submitted_at"], name="apology_submitted_at_idx"),
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:00
+
+import base64
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db import migrations, models, transaction
+from PIL import Image
+
+# Extensions are taken from the format Pillow detects, never from the stored header
+PIL_FORMAT_EXTENSIONS = {"PNG": "png", "JPEG": "jpg", "WEBP": "webp"}
+PIL_FORMAT_MIME_SUBTYPES = {"PNG": "png", "JPEG": "jpeg", "WEBP": "webp"}
+
+
+def move_signatures_to_files(apps, schema_editor):
+    """Decode base64 signature data URLs into image files and clear the blobs."""
+    ApologyLetter = apps.get_model("violations", "ApologyLetter")
+    letters = (
+        ApologyLetter.objects.filter(signature_data__startswith="data:image")
+        .only("id", "signature_data", "signature_image")
+    )
+    batch = []
+    for letter in letters.iterator(chunk_size=500):
+        _, _, payload = letter.signature_data.partition(";base64,")
+        if not payload:
+            continue
+        try:
+            image_data = base64.b64decode(payload)
+            with Image.open(BytesIO(image_data)) as image:
+                ext = PIL_FORMAT_EXTENSIONS.get(image.format)
+                image.verify()
+        except Exception:
+            continue
+        if ext is None:
+            # Leave anything that isn't a PNG/JPEG/WebP image in signature_data
+            continue
+        letter.signature_image.save(
+            f"signature_{letter.id}.{ext}", ContentFile(image_data), save=False
+        )
+        letter.signature_data = ""
+        batch.append(letter)
+        if len(batch) >= 500:
+            ApologyLetter.objects.bulk_update(batch, ["signature_image", "signature_data"])
+            batch = []
+    if batch:
+        ApologyLetter.objects.bulk_update(batch, ["signature_image", "signature_data"])
+
+
+def move_signature_files_to_data(apps, schema_editor):
+    """Encode signature image files back into data URLs before the column is dropped."""
+    ApologyLetter = apps.get_model("violations", "ApologyLetter")
+    storage = ApologyLetter._meta.get_field("signature_image").storage
+    letters = (
+        ApologyLetter.objects.exclude(signature_image="")
+        .exclude(signature_image__isnull=True)
+        .only("id", "signature_data", "signature_image")
+    )
+    batch = []
+    restored_names = []
+    for letter in letters.iterator(chunk_size=500):
+        name = letter.signature_image.name
+        if not storage.exists(name):
+            # Nothing left to restore; leave the row for the column drop
+            continue
+        with storage.open(name, "rb") as signature_file:
+            image_data = signature_file.read()
+        with Image.open(BytesIO(image_data)) as image:
+            subtype = PIL_FORMAT_MIME_SUBTYPES[image.format]
+        letter.signature_data = (
+            f"data:image/{subtype};base64,{base64.b64encode(image_data).decode('ascii')}"
+        )
+        letter.signature_image = None
+        batch.append(letter)
+        restored_names.append(name)
+        if len(batch) >= 500:
+            ApologyLetter.objects.bulk_update(batch, ["signature_image", "signature_data"])
+            batch = []
+    if batch:
+        ApologyLetter.objects.bulk_update(batch, ["signature_image", "signature_data"])
+
+    def delete_restored_files():
+        for restored_name in restored_names:
+            storage.delete(restored_name)
+
+    # Storage deletes can't be rolled back, so only remove the files once the
+    # data URLs are committed
+    transaction.on_commit(delete_restored_files, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("violations", "0029_add_violation_apology_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apologyletter",
+            name="signature_data",
+            field=models.TextField(
+                blank=True,
+                help_text="Base64 encoded signature image (legacy; new letters use signature_image)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="apologyletter",
+            name="signature_image",
+            field=models.ImageField(
+                blank=True,
+                help_text="Student signature image",
+                null=True,
+                upload_to="apology_letters/signatures/%Y/%m/",
+            ),
+        ),
+        migrations.RunPython(move_signatures_to_files, move_signature_files_to_data),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("violations", "0030_apologyletter_signature_image"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(
+                fields=["reported_by_guard", "status"], name="viol_guard_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="violation",
+            index=models.Index(
+                fields=["reported_by_guard", "-created_at"], name="viol_guard_created_idx"
+            ),
+        ),
+    ]
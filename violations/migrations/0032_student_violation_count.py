@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_violation_counts(apps, schema_editor):
+    """Set each student's stored violation_count from the existing violations."""
+    Student = apps.get_model("violations", "Student")
+    Violation = apps.get_model("violations", "Violation")
+    counts = (
+        Violation.objects.filter(student=OuterRef("pk"))
+        .order_by()
+        .values("student")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Student.objects.update(violation_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("violations", "0031_add_violation_guard_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="student",
+            name="violation_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_violation_counts, migrations.RunPython.noop),
+    ]
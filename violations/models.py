@@ -1,13 +1,23 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.core.validators import RegexValidator
 
 
+# Cache keys for derived data. The receivers in signals.py clear them on change, but
+# the cache is per process (no shared CACHES backend), so each entry also has a short TTL
+APOLOGY_STATUS_COUNTS_CACHE_KEY = "apology_status_counts"
+VIOLATION_TYPES_CACHE_KEY = "violation_types_ordered_v1"
+FORMATOR_TOP_STUDENTS_CACHE_KEY = "formator_top_students_v1"
+FORMATOR_RECENT_VIOLATIONS_CACHE_KEY = "formator_recent_violations_v1"
+FORMATOR_LETTERS_CACHE_KEY = "formator_letters_v1"
+
+
 # Validator for 8-digit student ID
 student_id_validator = RegexValidator(
 	regex=r'^\d{8}$',
@@ -67,10 +77,18 @@ class Student(models.Model):
 	guardian_name = models.CharField(max_length=100, blank=True)
 	guardian_contact = models.CharField(max_length=15, blank=True)
 	profile_image = models.ImageField(upload_to="profiles/students/", blank=True, null=True)
+	# Denormalized count of this student's violations, kept in sync by the Violation
+	# signals in signals.py so dashboards can rank students without a GROUP BY
+	violation_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
 
 	def __str__(self) -> str:  # pragma: no cover
 		return f"{self.student_id} - {self.user.get_full_name() or self.user.username}"
 
+	@cached_property
+	def display_name(self):
+		"""Full name of the student, falling back to the student ID."""
+		return self.user.get_full_name() or self.student_id
+
 	@property
 	def major_violation_count(self):
 		"""Count of major violations for this student (type == 'major')."""
@@ -480,19 +498,20 @@ class Message(models.Model):
 
 	def delete_for_user(self, user):
 		"""Soft delete message for a specific user."""
-		if user == self.sender:
+		# Compare ids so deferred/unloaded sender and receiver rows aren't fetched
+		if user.pk == self.sender_id:
 			self.deleted_by_sender = timezone.now()
 			self.save(update_fields=["deleted_by_sender"])
-		elif user == self.receiver:
+		elif user.pk == self.receiver_id:
 			self.deleted_by_receiver = timezone.now()
 			self.save(update_fields=["deleted_by_receiver"])
 
 	def restore_for_user(self, user):
 		"""Restore soft-deleted message for a specific user."""
-		if user == self.sender:
+		if user.pk == self.sender_id:
 			self.deleted_by_sender = None
 			self.save(update_fields=["deleted_by_sender"])
-		elif user == self.receiver:
+		elif user.pk == self.receiver_id:
 			self.deleted_by_receiver = None
 			self.save(update_fields=["deleted_by_receiver"])
 
@@ -665,6 +684,19 @@ class Violation(models.Model):
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
 
+	class Meta:
+		# Cover the filter/GROUP BY paths used by the dashboards and reports
+		indexes = [
+			models.Index(fields=["student", "-created_at"], name="viol_student_created_idx"),
+			models.Index(fields=["status"], name="viol_status_idx"),
+			models.Index(fields=["type"], name="viol_type_idx"),
+			models.Index(fields=["incident_at"], name="viol_incident_at_idx"),
+			models.Index(fields=["status", "incident_at"], name="viol_status_incident_idx"),
+			# Guard dashboard: per-guard status counts and latest-reports lists
+			models.Index(fields=["reported_by_guard", "status"], name="viol_guard_status_idx"),
+			models.Index(fields=["reported_by_guard", "-created_at"], name="viol_guard_created_idx"),
+		]
+
 	@property
 	def reporter(self):  # for template compatibility
 		return self.reported_by
@@ -912,7 +944,13 @@ class ApologyLetter(models.Model):
 	letter_program = models.CharField(max_length=300, blank=True, help_text="Program, Major, Year & Section")
 	letter_violations = models.TextField(blank=True, help_text="Specific violation/s")
 	letter_printed_name = models.CharField(max_length=200, blank=True, help_text="Printed name for signature")
-	signature_data = models.TextField(blank=True, help_text="Base64 encoded signature image")
+	signature_data = models.TextField(blank=True, help_text="Base64 encoded signature image (legacy; new letters use signature_image)")
+	signature_image = models.ImageField(
+		upload_to="apology_letters/signatures/%Y/%m/",
+		blank=True,
+		null=True,
+		help_text="Student signature image"
+	)
 
 	# Formator verification workflow fields
 	formator_status = models.CharField(max_length=20, choices=FormatorStatus.choices, default=FormatorStatus.NOT_SENT)
@@ -937,10 +975,22 @@ class ApologyLetter(models.Model):
 
 	class Meta:
 		ordering = ["-submitted_at"]
+		indexes = [
+			models.Index(fields=["status"], name="apology_status_idx"),
+			models.Index(fields=["formator_status"], name="apology_formator_status_idx"),
+			models.Index(fields=["submitted_at"], name="apology_submitted_at_idx"),
+		]
 
 	def __str__(self):
 		return f"Apology Letter from {self.student.student_id} for Violation #{self.violation.id}"
 
+	@property
+	def signature_src(self):
+		"""Image source for the student signature (file URL, or legacy data URL)."""
+		if self.signature_image:
+			return self.signature_image.url
+		return self.signature_data
+
 
 # Signal: create a StaffAlert when a Violation is created and the student's
 # effective major violations (3 minors = 1 major) reach the alert threshold.
@@ -950,29 +1000,32 @@ def violation_post_save_alert(sender, instance, created, **kwargs):
 		if not created:
 			return
 
-		student = instance.student
-
-		# Compute effective majors: majors + floor(minors / 3)
-		major_count = student.violations.filter(type='major').count()
-		minor_count = student.violations.filter(type='minor').count()
-		effective = major_count + (minor_count // 3)
-
-		# Threshold is 3 effective major violations
-		if effective >= 3:
-			# Only create an alert if there is no unresolved alert already
-			unresolved_exists = student.alerts.filter(resolved=False).exists()
-			if not unresolved_exists:
-				alert = StaffAlert.objects.create(
-					student=student,
-					triggered_violation=instance,
-					effective_major_count=effective,
-				)
+		# Savepoint: a failing query here rolls back only the alert, not the
+		# transaction the caller is saving the violation in
+		with transaction.atomic():
+			student = instance.student
+
+			# Compute effective majors: majors + floor(minors / 3)
+			major_count = student.violations.filter(type='major').count()
+			minor_count = student.violations.filter(type='minor').count()
+			effective = major_count + (minor_count // 3)
+
+			# Threshold is 3 effective major violations
+			if effective >= 3:
+				# Only create an alert if there is no unresolved alert already
+				unresolved_exists = student.alerts.filter(resolved=False).exists()
+				if not unresolved_exists:
+					alert = StaffAlert.objects.create(
+						student=student,
+						triggered_violation=instance,
+						effective_major_count=effective,
+					)
 				
-				# Notify all staff via email
-				staff_emails = list(User.objects.filter(role=User.Role.STAFF).values_list('email', flat=True))
-				if staff_emails:
-					subject = f"Student Alert: {student.student_id} Reached Violation Threshold"
-					message = f"""
+					# Notify all staff via email
+					staff_emails = list(User.objects.filter(role=User.Role.STAFF).values_list('email', flat=True))
+					if staff_emails:
+						subject = f"Student Alert: {student.student_id} Reached Violation Threshold"
+						message = f"""
 Dear Staff,
 
 A student has reached the violation threshold requiring immediate attention.
@@ -989,14 +1042,16 @@ This is an automated notification from the CHMSU Violation System.
 
 Regards,
 CHMSU Violation Monitoring System
-					""".strip()
-					send_mail(
-						subject,
-						message,
-						settings.DEFAULT_FROM_EMAIL,
-						staff_emails,
-						fail_silently=True,
-					)
+						""".strip()
+						# Send once the violation is committed (immediately outside a
+						# transaction), so SMTP isn't contacted inside the caller's transaction
+						transaction.on_commit(lambda: send_mail(
+							subject,
+							message,
+							settings.DEFAULT_FROM_EMAIL,
+							staff_emails,
+							fail_silently=True,
+						))
 	except Exception:
 		# Avoid raising errors during model save; log externally if available
 		pass
@@ -1,9 +1,17 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
-from .models import User, Student, OSACoordinator, Staff, LoginActivity, Violation, StaffAlert
+from .models import (
+    User, Student, OSACoordinator, Staff, LoginActivity, Violation, StaffAlert,
+    ApologyLetter, ViolationType,
+    APOLOGY_STATUS_COUNTS_CACHE_KEY, VIOLATION_TYPES_CACHE_KEY,
+    FORMATOR_TOP_STUDENTS_CACHE_KEY, FORMATOR_RECENT_VIOLATIONS_CACHE_KEY, FORMATOR_LETTERS_CACHE_KEY,
+)
 
 
 @receiver(post_save, sender=User)
@@ -99,24 +107,63 @@ def create_staff_alert_on_violation(sender, instance: Violation, created: bool,
         return
     
     try:
-        student = instance.student
-        effective_majors = student.effective_major_violations
+        # Savepoint: a failing query rolls back only the alert, not the caller's
+        # transaction that is saving the violation
+        with transaction.atomic():
+            student = instance.student
+            effective_majors = student.effective_major_violations
         
-        # Only create alert if student has 3+ effective major violations
-        if effective_majors >= 3:
-            # Check if there's already an unresolved alert for this student
-            existing_alert = StaffAlert.objects.filter(
-                student=student,
-                resolved=False,
-                dismissed_at__isnull=True
-            ).exists()
-            
-            if not existing_alert:
-                StaffAlert.objects.create(
+            # Only create alert if student has 3+ effective major violations
+            if effective_majors >= 3:
+                # Check if there's already an unresolved alert for this student
+                existing_alert = StaffAlert.objects.filter(
                     student=student,
-                    triggered_violation=instance,
-                    effective_major_count=effective_majors,
-                )
+                    resolved=False,
+                    dismissed_at__isnull=True
+                ).exists()
+            
+                if not existing_alert:
+                    StaffAlert.objects.create(
+                        student=student,
+                        triggered_violation=instance,
+                        effective_major_count=effective_majors,
+                    )
     except Exception:
         # Don't let alert creation failure block violation creation
         pass
+
+
+@receiver(post_save, sender=ApologyLetter)
+@receiver(post_delete, sender=ApologyLetter)
+def invalidate_apology_status_counts(sender, instance: ApologyLetter, **kwargs):
+    """Drop the cached apology status counts and the formator's letter lists."""
+    cache.delete_many([APOLOGY_STATUS_COUNTS_CACHE_KEY, FORMATOR_LETTERS_CACHE_KEY])
+
+
+@receiver(post_save, sender=ViolationType)
+@receiver(post_delete, sender=ViolationType)
+def invalidate_violation_types(sender, instance: ViolationType, **kwargs):
+    """Drop the cached violation type catalog used by the guard portal."""
+    cache.delete(VIOLATION_TYPES_CACHE_KEY)
+
+
+@receiver(post_save, sender=Violation)
+@receiver(post_delete, sender=Violation)
+def invalidate_formator_violation_lists(sender, instance: Violation, **kwargs):
+    """Drop the cached top-students and recent-violations lists on the formator dashboard."""
+    cache.delete_many([FORMATOR_TOP_STUDENTS_CACHE_KEY, FORMATOR_RECENT_VIOLATIONS_CACHE_KEY])
+
+
+@receiver(post_save, sender=Violation)
+def increment_student_violation_count(sender, instance: Violation, created: bool, **kwargs):
+    """Keep Student.violation_count in step with new violations."""
+    if created:
+        Student.objects.filter(pk=instance.student_id).update(violation_count=F("violation_count") + 1)
+
+
+@receiver(post_delete, sender=Violation)
+def decrement_student_violation_count(sender, instance: Violation, **kwargs):
+    """Keep Student.violation_count in step with deleted violations."""
+    Student.objects.filter(pk=instance.student_id, violation_count__gt=0).update(
+        violation_count=F("violation_count") - 1
+    )
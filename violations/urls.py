@@ -41,6 +41,8 @@ staff_patterns = [
     path('send-faculty-message/', views.staff_send_faculty_message_view, name='staff_send_faculty_message'),
     path('message/delete/', views.staff_delete_message_view, name='staff_delete_message'),
     path('message/restore/', views.staff_restore_message_view, name='staff_restore_message'),
+    path('message/bulk-delete/', views.staff_bulk_delete_messages_view, name='staff_bulk_delete_messages'),
+    path('message/bulk-restore/', views.staff_bulk_restore_messages_view, name='staff_bulk_restore_messages'),
     path('add-student/', views.staff_add_student_view, name='staff_add_student'),
     path('schedule-meeting/<int:alert_id>/', views.staff_schedule_meeting_view, name='staff_schedule_meeting'),
     path('resolve-alert/<int:alert_id>/', views.staff_resolve_alert_view, name='staff_resolve_alert'),
@@ -5,22 +5,35 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.utils.text import slugify
 from django.http import HttpResponse, JsonResponse
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Count, Sum, Case, When, IntegerField, Q
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db.models import Count, Sum, Case, When, IntegerField, Q, F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from django.db import models
 from datetime import datetime
 from io import BytesIO
+from PIL import Image
 import tempfile
+import traceback
 import os
 import csv
 import base64
 import json
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	from json import loads as _json_loads
+
 from .models import (
 	User, Student as StudentModel, Staff as StaffModel, OSACoordinator as OSACoordinatorModel,
-	Violation, ViolationType, LoginActivity,
+	Violation, ViolationType, LoginActivity, ActivityLog,
 	ViolationDocument, ApologyLetter,
-	Message, StaffAlert
+	Message, StaffAlert,
+	APOLOGY_STATUS_COUNTS_CACHE_KEY, VIOLATION_TYPES_CACHE_KEY,
+	FORMATOR_TOP_STUDENTS_CACHE_KEY, FORMATOR_RECENT_VIOLATIONS_CACHE_KEY, FORMATOR_LETTERS_CACHE_KEY,
 )
 from .decorators import login_required, role_required
 
@@ -137,7 +150,7 @@ def detect_face_view(request):
 		return JsonResponse({"error": "OpenCV not installed"}, status=501)
 	
 	try:
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		image_data = data.get('image', '')
 		
 		# Remove data URL prefix if present
@@ -219,6 +232,73 @@ def detect_face_view(request):
 		return JsonResponse({"error": str(e)}, status=500)
 
 
+# Data-URL image types we store, keyed by MIME subtype and by the format Pillow detects.
+# The file extension always comes from these maps, never from the client-supplied header,
+# so a payload like ``data:image/html`` can't be saved as a servable .html/.svg file
+_DATA_URL_IMAGE_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'jpg': 'jpg', 'webp': 'webp'}
+_PIL_FORMAT_EXTENSIONS = {'PNG': 'png', 'JPEG': 'jpg', 'WEBP': 'webp'}
+
+
+def _content_file_from_data_url(data_url, name_prefix):
+	"""Decode a ``data:image/...;base64,`` URL into a named ContentFile.
+
+	Returns None when the value is empty, not a base64 data URL of an allowed image type
+	(PNG, JPEG, WebP), or when the decoded bytes are not actually an image of that type.
+	"""
+	if not data_url or not data_url.startswith('data:image/'):
+		return None
+	# The header (``data:image/<type>;base64,``) is short, so only search its first bytes
+	# rather than scanning a multi-megabyte payload when the marker is missing
+	header_end = data_url.find(';base64,', 0, 64)
+	if header_end == -1:
+		return None
+	ext = _DATA_URL_IMAGE_EXTENSIONS.get(data_url[len('data:image/'):header_end].lower())
+	payload = data_url[header_end + len(';base64,'):]
+	if ext is None or not payload:
+		return None
+	try:
+		image_data = base64.b64decode(payload)
+	except (ValueError, TypeError):
+		return None
+	try:
+		with Image.open(BytesIO(image_data)) as image:
+			image_format = image.format
+			image.verify()
+	except Exception:
+		return None
+	if _PIL_FORMAT_EXTENSIONS.get(image_format) != ext:
+		return None
+	return ContentFile(image_data, name=f"{name_prefix}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.{ext}")
+
+
+def _safe_year(value, default=1):
+	"""Parse a submitted year level, falling back to ``default`` when it isn't a number."""
+	try:
+		return int(value)
+	except (ValueError, TypeError):
+		return default
+
+
+def _build_student_kwargs(student_id, program, year_level, suffix='', contact_number='',
+		guardian_name='', guardian_contact=''):
+	"""Field values for a Student profile registered by staff or a guard.
+
+	The department mirrors the program (college), and the year level is stamped as
+	assigned now for auto-promotion. enrollment_status is left to its model default.
+	"""
+	return {
+		'student_id': student_id,
+		'suffix': suffix,
+		'program': program,
+		'year_level': year_level,
+		'year_level_assigned_at': timezone.now(),
+		'department': program,
+		'contact_number': contact_number or '',
+		'guardian_name': guardian_name or '',
+		'guardian_contact': guardian_contact or '',
+	}
+
+
 def get_head_size_guidance(head_size):
 	"""Return user-friendly guidance based on head size detection."""
 	guidance = {
@@ -305,8 +385,8 @@ def student_login_auth(request):
 		messages.error(request, "Your account is inactive. Please contact support.")
 		return render(request, "violations/student/login.html", status=403)
 
-	# Log in the user via default backend (no password flow for Student ID auth)
-	login(request, user, backend="django.contrib.auth.backends.ModelBackend")
+	# Log in the user via the app backend (no password flow for Student ID auth)
+	login(request, user, backend="violations.backends.StudentProfileBackend")
 	return redirect("violations:route_dashboard")
 
 
@@ -378,7 +458,7 @@ def credentials_login_auth(request):
 		messages.error(request, "Only Django admin superusers can sign in as OSA Coordinator.")
 		return render(request, login_template, status=403)
 
-	login(request, user, backend="django.contrib.auth.backends.ModelBackend")
+	login(request, user, backend="violations.backends.StudentProfileBackend")
 	return redirect("violations:route_dashboard")
 
 
@@ -483,7 +563,10 @@ def signup_view(request):
 				student.enrollment_status = enrollment_status
 				student.guardian_name = guardian_name
 				student.guardian_contact = guardian_contact
-				student.save()
+				student.save(update_fields=[
+					"student_id", "year_level", "program", "department",
+					"enrollment_status", "guardian_name", "guardian_contact",
+				])
 
 		except IntegrityError as e:
 			# Likely duplicate email/username/student_id
@@ -491,7 +574,7 @@ def signup_view(request):
 			return render(request, "violations/signup.html", status=400)
 
 		# Auto-login and route to role dashboard
-		login(request, user)
+		login(request, user, backend="violations.backends.StudentProfileBackend")
 		return redirect("violations:route_dashboard")
 
 	# GET: render UI
@@ -575,20 +658,27 @@ def student_update_profile_view(request):
 		if not student:
 			return JsonResponse({'success': False, 'error': 'Student profile not found'})
 		
+		# Only the edited columns are saved, so the signal-maintained violation_count
+		# is never overwritten with the value loaded at the start of the request
+		changed_fields = []
+		
 		# Update contact number
 		contact_number = request.POST.get('contact_number', '').strip()
 		if contact_number:
 			student.contact_number = contact_number
+			changed_fields.append('contact_number')
 		
 		# Update guardian name
 		guardian_name = request.POST.get('guardian_name', '').strip()
 		if guardian_name:
 			student.guardian_name = guardian_name
+			changed_fields.append('guardian_name')
 		
 		# Update guardian contact
 		guardian_contact = request.POST.get('guardian_contact', '').strip()
 		if guardian_contact:
 			student.guardian_contact = guardian_contact
+			changed_fields.append('guardian_contact')
 		
 		# Update email (on User model)
 		email = request.POST.get('email', '').strip()
@@ -613,8 +703,10 @@ def student_update_profile_view(request):
 			if student.profile_image:
 				student.profile_image.delete(save=False)
 			student.profile_image = profile_image
+			changed_fields.append('profile_image')
 		
-		student.save()
+		if changed_fields:
+			student.save(update_fields=changed_fields)
 		
 		return JsonResponse({'success': True, 'message': 'Profile updated successfully'})
 	except Exception as e:
@@ -767,7 +859,8 @@ def faculty_student_detail_view(request, student_id: str):
 	pending_v = vqs.filter(status__in=[Violation.Status.REPORTED, Violation.Status.UNDER_REVIEW]).count()
 	resolved_v = vqs.filter(status=Violation.Status.RESOLVED).count()
 	dismissed_v = vqs.filter(status=Violation.Status.DISMISSED).count()
-	latest_incident = vqs.first().incident_at if total_v else None
+	# Only the date is needed, so skip building the model (and its reporter join)
+	latest_incident = vqs.values_list("incident_at", flat=True).first()
 	
 	# CGMC (Certificate of Good Moral Character) eligibility
 	cgmc = student.cgmc_eligibility
@@ -947,8 +1040,7 @@ def faculty_update_case_status_view(request):
 		violation.save()
 		
 		# Log the activity
-		from .models import ActivityLog
-		student_name = violation.student.user.get_full_name() or violation.student.student_id
+		student_name = violation.student.display_name
 		new_status_display = violation.get_status_display()
 		ActivityLog.log_activity(
 			action_type=ActivityLog.ActionType.VIOLATION_UPDATED,
@@ -992,7 +1084,6 @@ def faculty_activity_logs_view(request):
 	OSA Coordinator: View all activity logs across the system.
 	Shows activities from Staff, Students, Guards, and Formators.
 	"""
-	from .models import ActivityLog
 	
 	# Get filter parameters
 	user_role = request.GET.get('role', 'all')
@@ -1093,7 +1184,6 @@ def faculty_delete_activity_log_view(request, log_id):
 	"""
 	OSA Coordinator: Delete an activity log entry.
 	"""
-	from .models import ActivityLog
 	
 	if request.method != 'POST':
 		return JsonResponse({'error': 'Method not allowed'}, status=405)
@@ -1989,7 +2079,8 @@ def staff_student_detail_view(request, student_id: str):
 	pending_v = vqs.filter(status__in=[Violation.Status.REPORTED, Violation.Status.UNDER_REVIEW]).count()
 	resolved_v = vqs.filter(status=Violation.Status.RESOLVED).count()
 	dismissed_v = vqs.filter(status=Violation.Status.DISMISSED).count()
-	latest_incident = vqs.first().incident_at if total_v else None
+	# Only the date is needed, so skip building the model (and its reporter join)
+	latest_incident = vqs.values_list("incident_at", flat=True).first()
 	
 	# Meeting statistics
 	from .models import StaffAlert
@@ -2149,7 +2240,7 @@ def staff_check_student_view(request):
 		return JsonResponse({
 			'exists': True,
 			'student_id': student.student_id,
-			'student_name': student.user.get_full_name() or student.student_id,
+			'student_name': student.display_name,
 			'program': student.program,
 			'year_level': student.year_level,
 		})
@@ -2209,6 +2300,7 @@ def staff_violation_create_view(request):
 			
 			# Create a User account for the new student
 			username = student_id.replace('-', '').lower()
+			year_level_int = _safe_year(year_level)
 			
 			# Check if user already exists with this username
 			existing_user = User.objects.filter(username=username).first()
@@ -2221,56 +2313,39 @@ def staff_violation_create_view(request):
 					messages.info(request, f"Found existing student record for user '{username}'.")
 				else:
 					# User exists but no student profile - create one
-					try:
-						year_level_int = int(year_level)
-					except (ValueError, TypeError):
-						year_level_int = 1
-					
 					student = StudentModel.objects.create(
 						user=existing_user,
-						student_id=student_id,
-						suffix=suffix,
-						program=program,
-						year_level=year_level_int,
-						year_level_assigned_at=timezone.now(),
-						department=program,
-						contact_number=contact_number,
-						guardian_name=guardian_name,
-						guardian_contact=guardian_contact,
-						enrollment_status='Active'
+						**_build_student_kwargs(
+							student_id, program, year_level_int, suffix=suffix, contact_number=contact_number,
+							guardian_name=guardian_name, guardian_contact=guardian_contact,
+						)
 					)
 					student_created = True
 			else:
-				# Create new user and student profile
+				# Create new user and student profile in one transaction
 				full_last_name = f"{last_name} {suffix}".strip() if suffix else last_name
-				user = User.objects.create_user(
-					username=username,
-					first_name=first_name,
-					last_name=full_last_name,
-					password=student_id,  # Default password is student ID
-					email=email or f"{username}@student.chmsu.edu.ph",
-					role=User.Role.STUDENT
-				)
-				
-				# Create the Student profile
 				try:
-					year_level_int = int(year_level)
-				except (ValueError, TypeError):
-					year_level_int = 1
+					with transaction.atomic():
+						user = User.objects.create_user(
+							username=username,
+							first_name=first_name,
+							last_name=full_last_name,
+							password=student_id,  # Default password is student ID
+							email=email or f"{username}@student.chmsu.edu.ph",
+							role=User.Role.STUDENT
+						)
 				
-				student = StudentModel.objects.create(
-					user=user,
-					student_id=student_id,
-					suffix=suffix,
-					program=program,
-					year_level=year_level_int,
-					year_level_assigned_at=timezone.now(),
-					department=program,
-					contact_number=contact_number,
-					guardian_name=guardian_name,
-					guardian_contact=guardian_contact,
-					enrollment_status='Active'
-				)
+						# The post_save signal already created a bare profile for this user
+						student, _ = StudentModel.objects.update_or_create(
+							user=user,
+							defaults=_build_student_kwargs(
+								student_id, program, year_level_int, suffix=suffix, contact_number=contact_number,
+								guardian_name=guardian_name, guardian_contact=guardian_contact,
+							)
+						)
+				except IntegrityError:
+					messages.error(request, f"A user with Student ID '{student_id}' or email '{email}' already exists.")
+					return redirect('violations:staff_violation_create')
 				student_created = True
 		
 		# Parse incident datetime
@@ -2285,52 +2360,52 @@ def staff_violation_create_view(request):
 			except ValueError:
 				pass
 		
-		# Get violation type from catalog OR use other violation
-		catalog_violation_type = None
-		if violation_type_id:
-			catalog_violation_type = ViolationType.objects.filter(id=violation_type_id, is_active=True).first()
-			# Auto-set the severity based on violation type category
-			if catalog_violation_type:
-				violation_type = catalog_violation_type.category
-		elif other_violation:
-			# Using "Other Violation" - prepend to description
-			description = f"[Other Violation: {other_violation}]\n\n{description}" if description else f"[Other Violation: {other_violation}]"
-			# Use category from radio button (passed via hidden field)
-			violation_type = type_from_other or other_category or Violation.Severity.MINOR
-		
-		# Default to minor if no type selected
-		if not violation_type:
-			violation_type = Violation.Severity.MINOR
-		
-		# Create violation
-		violation = Violation.objects.create(
-			student=student,
-			reported_by=request.user,
-			description=description,
-			type=violation_type,
-			violation_type=catalog_violation_type,
-			location=location or 'Not specified',
-			incident_at=incident_at,
-			status=Violation.Status.REPORTED,
-		)
+		# Catalog lookup, insert, activity log and offense count share one commit
+		with transaction.atomic():
+			# Get violation type from catalog OR use other violation
+			catalog_violation_type = None
+			if violation_type_id:
+				catalog_violation_type = ViolationType.objects.filter(id=violation_type_id, is_active=True).first()
+				# Auto-set the severity based on violation type category
+				if catalog_violation_type:
+					violation_type = catalog_violation_type.category
+			elif other_violation:
+				# Using "Other Violation" - prepend to description
+				description = f"[Other Violation: {other_violation}]\n\n{description}" if description else f"[Other Violation: {other_violation}]"
+				# Use category from radio button (passed via hidden field)
+				violation_type = type_from_other or other_category or Violation.Severity.MINOR
+		
+			# Default to minor if no type selected
+			if not violation_type:
+				violation_type = Violation.Severity.MINOR
+		
+			# Create violation
+			violation = Violation.objects.create(
+				student=student,
+				reported_by=request.user,
+				description=description,
+				type=violation_type,
+				violation_type=catalog_violation_type,
+				location=location or 'Not specified',
+				incident_at=incident_at,
+				status=Violation.Status.REPORTED,
+			)
 		
-		# Log the activity
-		from .models import ActivityLog
-		student_name = student.user.get_full_name() or student.student_id
-		ActivityLog.log_activity(
-			action_type=ActivityLog.ActionType.VIOLATION_CREATED,
-			description=f"Created violation #{violation.id} for {student_name}: {description[:100]}..." if len(description) > 100 else f"Created violation #{violation.id} for {student_name}: {description}",
-			request=request,
-			user=request.user,
-			related_student=student,
-			related_violation=violation
-		)
+			# Log the activity
+			student_name = student.display_name
+			ActivityLog.log_activity(
+				action_type=ActivityLog.ActionType.VIOLATION_CREATED,
+				description=f"Created violation #{violation.id} for {student_name}: {description[:100]}..." if len(description) > 100 else f"Created violation #{violation.id} for {student_name}: {description}",
+				request=request,
+				user=request.user,
+				related_student=student,
+				related_violation=violation
+			)
 		
-		# Track offense frequency for this student
-		offense_count = Violation.objects.filter(student=student).count()
+			# Track offense frequency for this student
+			offense_count = Violation.objects.filter(student=student).count()
 		
 		# Build success message
-		student_name = student.user.get_full_name() or student.student_id
 		if student_created:
 			messages.success(request, f"Violation #{violation.id} created successfully. New student \"{student_name}\" ({student_id}) was automatically registered. This is offense #{offense_count}.")
 		else:
@@ -2398,8 +2473,7 @@ def staff_violation_edit_view(request, violation_id):
 		violation.save()
 		
 		# Log the activity
-		from .models import ActivityLog
-		student_name = violation.student.user.get_full_name() or violation.student.student_id
+		student_name = violation.student.display_name
 		ActivityLog.log_activity(
 			action_type=ActivityLog.ActionType.VIOLATION_UPDATED,
 			description=f"Updated violation #{violation.id} for {student_name}",
@@ -2439,7 +2513,7 @@ def staff_violation_delete_view(request, violation_id):
 	)
 	
 	if request.method == 'POST':
-		student_name = violation.student.user.get_full_name() or violation.student.student_id
+		student_name = violation.student.display_name
 		violation_id_str = f"#{violation.id}"
 		
 		# Delete the violation (cascade deletes related documents, etc.)
@@ -2469,7 +2543,8 @@ def staff_violation_detail_view(request, violation_id):
 	
 	# Get offense history for the student
 	student_violations = Violation.objects.filter(student=violation.student).order_by('-created_at')
-	offense_number = list(student_violations).index(violation) + 1 if violation in student_violations else 1
+	# Position in the newest-first history, counted in SQL rather than by loading every row
+	offense_number = student_violations.filter(created_at__gt=violation.created_at).count() + 1
 	total_offenses = student_violations.count()
 	
 	ctx = {
@@ -2493,8 +2568,7 @@ def staff_verify_violation_view(request, violation_id):
 		notes = request.POST.get('notes', '').strip()
 		
 		# Update violation status based on action
-		from .models import ActivityLog
-		student_name = violation.student.user.get_full_name() or violation.student.student_id
+		student_name = violation.student.display_name
 		
 		if action == 'verified':
 			if violation.status == Violation.Status.REPORTED:
@@ -2535,6 +2609,20 @@ def staff_verify_violation_view(request, violation_id):
 	return redirect('violations:staff_violation_detail', violation_id=violation.id)
 
 
+def _apology_status_counts():
+	"""Counts of apology letters per status, from one cached conditional aggregate."""
+	status_counts = cache.get(APOLOGY_STATUS_COUNTS_CACHE_KEY)
+	if status_counts is None:
+		status_counts = ApologyLetter.objects.aggregate(
+			pending=Count('id', filter=Q(status=ApologyLetter.Status.PENDING)),
+			approved=Count('id', filter=Q(status=ApologyLetter.Status.APPROVED)),
+			rejected=Count('id', filter=Q(status=ApologyLetter.Status.REJECTED)),
+			revision=Count('id', filter=Q(status=ApologyLetter.Status.REVISION_NEEDED)),
+		)
+		cache.set(APOLOGY_STATUS_COUNTS_CACHE_KEY, status_counts, 60)
+	return status_counts
+
+
 @role_required({User.Role.STAFF})
 def staff_apology_letters_view(request):
 	"""Staff: View and manage apology letter submissions."""
@@ -2564,20 +2652,17 @@ def staff_apology_letters_view(request):
 	except (PageNotAnInteger, EmptyPage):
 		letters = paginator.page(1)
 	
-	# Stats
-	pending_count = ApologyLetter.objects.filter(status=ApologyLetter.Status.PENDING).count()
-	approved_count = ApologyLetter.objects.filter(status=ApologyLetter.Status.APPROVED).count()
-	rejected_count = ApologyLetter.objects.filter(status=ApologyLetter.Status.REJECTED).count()
-	revision_count = ApologyLetter.objects.filter(status=ApologyLetter.Status.REVISION_NEEDED).count()
+	# Stats (unfiltered, so one cached conditional aggregate serves every request)
+	status_counts = _apology_status_counts()
 	
 	ctx = {
 		'letters': letters,
 		'status_filter': status_filter,
 		'search_query': search_query,
-		'pending_count': pending_count,
-		'approved_count': approved_count,
-		'rejected_count': rejected_count,
-		'revision_count': revision_count,
+		'pending_count': status_counts['pending'],
+		'approved_count': status_counts['approved'],
+		'rejected_count': status_counts['rejected'],
+		'revision_count': status_counts['revision'],
 	}
 	return render(request, 'violations/staff/apology_letters.html', ctx)
 
@@ -2585,21 +2670,29 @@ def staff_apology_letters_view(request):
 @role_required({User.Role.STAFF})
 def staff_verify_apology_view(request, letter_id):
 	"""Staff: Verify or reject an apology letter."""
-	from .models import ActivityLog
 	letter = get_object_or_404(ApologyLetter.objects.select_related('student', 'violation'), id=letter_id)
 	
 	if request.method == 'POST':
 		action = request.POST.get('action', 'approved')
 		remarks = request.POST.get('remarks', '').strip()
 		
+		# Write only the review columns instead of re-saving the whole letter row
+		verified_at = timezone.now()
+		ApologyLetter.objects.filter(pk=letter.pk).update(
+			status=action,
+			verified_by=request.user,
+			verified_at=verified_at,
+			remarks=remarks,
+		)
+		# update() skips post_save, so clear the cached status counts here
+		cache.delete(APOLOGY_STATUS_COUNTS_CACHE_KEY)
 		letter.status = action
 		letter.verified_by = request.user
-		letter.verified_at = timezone.now()
+		letter.verified_at = verified_at
 		letter.remarks = remarks
-		letter.save()
 		
 		# Log the activity
-		student_name = letter.student.user.get_full_name() or letter.student.student_id
+		student_name = letter.student.display_name
 		if action == ApologyLetter.Status.APPROVED:
 			# Auto-resolve the violation when apology is approved
 			violation = letter.violation
@@ -2648,7 +2741,6 @@ def staff_verify_apology_view(request, letter_id):
 @role_required({User.Role.STAFF})
 def staff_send_to_formator_view(request, letter_id):
 	"""Staff: Send apology letter to Student Formator for verification."""
-	from .models import ActivityLog
 	letter = get_object_or_404(ApologyLetter.objects.select_related('student', 'student__user', 'violation'), id=letter_id)
 	
 	if request.method == 'POST':
@@ -2658,7 +2750,7 @@ def staff_send_to_formator_view(request, letter_id):
 		letter.save()
 		
 		# Log the activity
-		student_name = letter.student.user.get_full_name() or letter.student.student_id
+		student_name = letter.student.display_name
 		ActivityLog.log_activity(
 			user=request.user,
 			action_type=ActivityLog.ActionType.APOLOGY_SENT_FORMATOR,
@@ -2689,7 +2781,10 @@ def staff_reports_view(request):
 	start_date_obj = None
 	end_date_obj = None
 	
-	violations = Violation.objects.select_related('student', 'student__user', 'reported_by', 'violation_type')
+	# The report never renders the free-text columns, so skip them
+	violations = Violation.objects.select_related(
+		'student', 'student__user', 'reported_by', 'violation_type'
+	).defer('description', 'witness_statement')
 	
 	if start_date:
 		try:
@@ -2708,8 +2803,9 @@ def staff_reports_view(request):
 	# ============================================
 	# BASIC VIOLATION STATISTICS
 	# ============================================
-	total_violations = violations.count()
-	by_type = violations.values('type').annotate(count=Count('id'))
+	# One GROUP BY scan yields both the per-type breakdown and the total
+	by_type = list(violations.values('type').annotate(count=Count('id')).order_by())
+	total_violations = sum(row['count'] for row in by_type)
 	by_status = violations.values('status').annotate(count=Count('id'))
 	
 	# Status counts
@@ -2777,9 +2873,9 @@ def staff_reports_view(request):
 	# ============================================
 	# PROGRAM/DEPARTMENT BREAKDOWN
 	# ============================================
-	program_stats = violations.values('student__program').annotate(
+	program_stats = list(violations.values('student__program').annotate(
 		count=Count('id')
-	).order_by('-count')[:10]
+	).order_by('-count')[:10])
 	
 	program_breakdown = []
 	program_colors = ['#1a472a', '#2d6a3f', '#059669', '#10b981', '#34d399', '#6ee7b7', '#3b82f6', '#6366f1', '#8b5cf6', '#a855f7']
@@ -2797,9 +2893,10 @@ def staff_reports_view(request):
 	# ============================================
 	# YEAR LEVEL ANALYSIS
 	# ============================================
-	year_level_stats = violations.values('student__year_level').annotate(
+	# Materialize once: both max() and the loop below iterate these rows
+	year_level_stats = list(violations.values('student__year_level').annotate(
 		count=Count('id')
-	).order_by('student__year_level')
+	).order_by('student__year_level'))
 	
 	year_level_breakdown = []
 	max_year_count = max([yl['count'] for yl in year_level_stats], default=1)
@@ -2839,11 +2936,19 @@ def staff_reports_view(request):
 	# ============================================
 	# TOP OFFENDERS
 	# ============================================
-	top_offenders = (
-		violations.values('student__student_id', 'student__user__first_name', 'student__user__last_name')
+	# Group on the integer FK only, then resolve names for the top 10 in one IN query
+	top_counts = list(
+		violations.values('student_id')
 		.annotate(count=Count('id'))
 		.order_by('-count')[:10]
 	)
+	top_students = StudentModel.objects.select_related('user').in_bulk(
+		[row['student_id'] for row in top_counts]
+	)
+	top_offenders = [
+		{'student': top_students.get(row['student_id']), 'count': row['count']}
+		for row in top_counts
+	]
 	
 	# ============================================
 	# MONTHLY TREND (Last 6 months or date range)
@@ -2863,7 +2968,7 @@ def staff_reports_view(request):
 		trend_start = trend_end - timedelta(days=180)
 	
 	# Get actual violation counts per month
-	monthly_data = (
+	monthly_data = list(
 		violations.filter(incident_at__date__gte=trend_start, incident_at__date__lte=trend_end)
 		.annotate(month=TruncMonth('incident_at'))
 		.values('month')
@@ -3010,7 +3115,7 @@ def staff_export_report_view(request):
 		writer.writerow([
 			v.id,
 			v.student.student_id,
-			v.student.user.get_full_name() or v.student.student_id,
+			v.student.display_name,
 			v.description,
 			v.type,
 			v.status,
@@ -3110,7 +3215,6 @@ Generated: {timezone.now().strftime('%B %d, %Y at %I:%M %p')}"""
 		sent_count += 1
 	
 	# Log the activity
-	from .models import ActivityLog
 	ActivityLog.log_activity(
 		action_type='report_sent',
 		description=f"Sent violation report summary to {sent_count} coordinator(s). {period_text}",
@@ -3159,7 +3263,7 @@ def staff_send_message_view(request):
 			content=message_content
 		)
 		
-		messages.success(request, f"Message sent to {student.user.get_full_name() or student.student_id}.")
+		messages.success(request, f"Message sent to {student.display_name}.")
 		return redirect('violations:staff_dashboard')
 	
 	return redirect('violations:staff_dashboard')
@@ -3176,8 +3280,10 @@ def staff_send_faculty_message_view(request):
 			messages.error(request, 'Please select a faculty member and enter a message.')
 			return redirect('violations:staff_dashboard')
 		
-		# Find the OSA Coordinator user
-		faculty_user = User.objects.filter(id=faculty_id, role=User.Role.OSA_COORDINATOR).first()
+		# Find the OSA Coordinator user (only the columns needed for the FK and the name)
+		faculty_user = User.objects.only('id', 'role', 'first_name', 'last_name', 'username').filter(
+			id=faculty_id, role=User.Role.OSA_COORDINATOR
+		).first()
 		if not faculty_user:
 			messages.error(request, 'OSA Coordinator not found.')
 			return redirect('violations:staff_dashboard')
@@ -3199,8 +3305,11 @@ def staff_send_faculty_message_view(request):
 @role_required({User.Role.STUDENT})
 def student_mark_message_read_view(request, message_id):
 	"""Student: Mark a message as read."""
-	message_obj = get_object_or_404(Message, id=message_id, receiver=request.user)
-	message_obj.mark_read()
+	# Single UPDATE on the unread path; only probe for existence when nothing changed
+	received = Message.objects.filter(id=message_id, receiver=request.user)
+	updated = received.filter(read_at__isnull=True).update(read_at=timezone.now())
+	if not updated and not received.exists():
+		return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 	return JsonResponse({'status': 'ok'})
 
 
@@ -3211,8 +3320,7 @@ def student_reply_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		reply_text = data.get('reply', '').strip()
 		
@@ -3278,51 +3386,57 @@ def staff_add_student_view(request):
 			messages.error(request, "Guardian contact must be exactly 11 digits.")
 			return redirect('violations:staff_dashboard')
 		
-		# Check if student ID already exists
-		if StudentModel.objects.filter(student_id__iexact=student_id).exists():
+		# Check student ID, username and email (if provided) for conflicts in one query.
+		# Student IDs are digits only, so exact matches are case-insensitive here.
+		conflict_q = Q(student_profile__student_id=student_id) | Q(username=username)
+		conflict_counts = {
+			'student_id': Count('id', filter=Q(student_profile__student_id=student_id)),
+			'username': Count('id', filter=Q(username=username)),
+		}
+		if email:
+			conflict_q |= Q(email__iexact=email)
+			conflict_counts['email'] = Count('id', filter=Q(email__iexact=email))
+		conflicts = User.objects.filter(conflict_q).aggregate(**conflict_counts)
+		
+		if conflicts['student_id']:
 			messages.error(request, f"A student with ID '{student_id}' already exists.")
 			return redirect('violations:staff_dashboard')
 		
-		# Check if username already exists
-		if User.objects.filter(username__iexact=username).exists():
+		if conflicts['username']:
 			messages.error(request, f"A user with this Student ID already exists.")
 			return redirect('violations:staff_dashboard')
 		
-		# Check if email already exists (if provided)
-		if email and User.objects.filter(email__iexact=email).exists():
+		if conflicts.get('email'):
 			messages.error(request, f"Email '{email}' is already registered.")
 			return redirect('violations:staff_dashboard')
 		
 		try:
-			# Create the user account (no password needed - student logs in via Student ID)
-			user = User.objects.create_user(
-				username=username,
-				email=email or None,
-				password=None,  # No password - student ID login
-				first_name=first_name,
-				last_name=f"{last_name} {suffix}".strip() if suffix else last_name,
-				role=User.Role.STUDENT
-			)
-			
-			# Update the student profile (signal auto-creates it with blank fields)
-			# Use update_or_create to handle both cases
-			StudentModel.objects.update_or_create(
-				user=user,
-				defaults={
-					'student_id': student_id,
-					'suffix': suffix,
-					'program': program,
-					'year_level': int(year_level),
-					'year_level_assigned_at': timezone.now(),
-					'department': program,  # Use program/college as department
-					'contact_number': contact_number or '',
-					'guardian_name': guardian_name or '',
-					'guardian_contact': guardian_contact or '',
-					'enrollment_status': 'Active'
-				}
-			)
+			# User and profile are committed together so a failed profile write can't leave an orphan user
+			with transaction.atomic():
+				# Create the user account (no password needed - student logs in via Student ID)
+				user = User.objects.create_user(
+					username=username,
+					email=email or None,
+					password=None,  # No password - student ID login
+					first_name=first_name,
+					last_name=f"{last_name} {suffix}".strip() if suffix else last_name,
+					role=User.Role.STUDENT
+				)
+				
+				# Update the student profile (signal auto-creates it with blank fields)
+				# Use update_or_create to handle both cases
+				StudentModel.objects.update_or_create(
+					user=user,
+					defaults=_build_student_kwargs(
+						student_id, program, int(year_level), suffix=suffix, contact_number=contact_number,
+						guardian_name=guardian_name, guardian_contact=guardian_contact,
+					)
+				)
 			
 			messages.success(request, f"Student '{first_name} {last_name}' ({student_id}) has been added successfully.")
+		except IntegrityError as e:
+			# Lost a race with a concurrent registration after the conflict check
+			messages.error(request, f"A student with this ID or email already exists: {str(e)}")
 		except Exception as e:
 			messages.error(request, f"Error creating student: {str(e)}")
 		
@@ -3338,8 +3452,7 @@ def staff_delete_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		message_type = data.get('type', 'sent')  # 'sent' or 'received'
 		
@@ -3366,19 +3479,16 @@ def staff_restore_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		
 		if not message_id:
 			return JsonResponse({'status': 'error', 'error': 'Missing message_id'}, status=400)
 		
 		# Find message where user is sender or receiver
-		msg = Message.objects.filter(id=message_id).filter(
-			models.Q(sender=request.user) | models.Q(receiver=request.user)
-		).first()
+		msg = Message.objects.filter(pk=message_id).only('id', 'sender', 'receiver').first()
 		
-		if not msg:
+		if not msg or request.user.pk not in (msg.sender_id, msg.receiver_id):
 			return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 		
 		msg.restore_for_user(request.user)
@@ -3389,6 +3499,75 @@ def staff_restore_message_view(request):
 		return JsonResponse({'status': 'error', 'error': str(e)}, status=500)
 
 
+def _bulk_set_message_trash(user, message_ids, deleted_at):
+	"""Set the user's trash timestamp on many messages in one SELECT and one UPDATE.
+
+	``deleted_at`` is a datetime to trash the messages or None to restore them.
+	Returns the number of messages touched.
+	"""
+	msgs = list(
+		Message.objects.filter(id__in=message_ids)
+		.filter(Q(sender=user) | Q(receiver=user))
+		.only('id', 'sender', 'receiver', 'deleted_by_sender', 'deleted_by_receiver')
+	)
+	for msg in msgs:
+		if msg.sender_id == user.pk:
+			msg.deleted_by_sender = deleted_at
+		if msg.receiver_id == user.pk:
+			msg.deleted_by_receiver = deleted_at
+	Message.objects.bulk_update(msgs, ['deleted_by_sender', 'deleted_by_receiver'], batch_size=500)
+	return len(msgs)
+
+
+def _parse_message_ids(request):
+	"""Return the list of integer ``message_ids`` from a JSON body, or None if malformed."""
+	ids = _json_loads(request.body).get('message_ids')
+	if not isinstance(ids, list):
+		return None
+	try:
+		return [int(i) for i in ids]
+	except (TypeError, ValueError):
+		return None
+
+
+@role_required({User.Role.STAFF})
+def staff_bulk_delete_messages_view(request):
+	"""Staff: Move several messages to trash at once."""
+	if request.method != 'POST':
+		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
+	
+	try:
+		message_ids = _parse_message_ids(request)
+		if not message_ids:
+			return JsonResponse({'status': 'error', 'error': 'Missing message_ids'}, status=400)
+		
+		updated = _bulk_set_message_trash(request.user, message_ids, timezone.now())
+		return JsonResponse({'status': 'ok', 'updated': updated})
+	except (json.JSONDecodeError, ValueError, AttributeError):
+		return JsonResponse({'status': 'error', 'error': 'Invalid JSON'}, status=400)
+	except Exception as e:
+		return JsonResponse({'status': 'error', 'error': str(e)}, status=500)
+
+
+@role_required({User.Role.STAFF})
+def staff_bulk_restore_messages_view(request):
+	"""Staff: Restore several messages from trash at once."""
+	if request.method != 'POST':
+		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
+	
+	try:
+		message_ids = _parse_message_ids(request)
+		if not message_ids:
+			return JsonResponse({'status': 'error', 'error': 'Missing message_ids'}, status=400)
+		
+		updated = _bulk_set_message_trash(request.user, message_ids, None)
+		return JsonResponse({'status': 'ok', 'updated': updated})
+	except (json.JSONDecodeError, ValueError, AttributeError):
+		return JsonResponse({'status': 'error', 'error': 'Invalid JSON'}, status=400)
+	except Exception as e:
+		return JsonResponse({'status': 'error', 'error': str(e)}, status=500)
+
+
 @role_required({User.Role.STUDENT})
 def student_delete_message_view(request):
 	"""Student: Move a message to trash (soft delete)."""
@@ -3396,19 +3575,16 @@ def student_delete_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		
 		if not message_id:
 			return JsonResponse({'status': 'error', 'error': 'Missing message_id'}, status=400)
 		
 		# Student can delete received messages (from staff) or sent messages (replies)
-		msg = Message.objects.filter(id=message_id).filter(
-			models.Q(sender=request.user) | models.Q(receiver=request.user)
-		).first()
+		msg = Message.objects.filter(pk=message_id).only('id', 'sender', 'receiver').first()
 		
-		if not msg:
+		if not msg or request.user.pk not in (msg.sender_id, msg.receiver_id):
 			return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 		
 		msg.delete_for_user(request.user)
@@ -3426,18 +3602,15 @@ def student_restore_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		
 		if not message_id:
 			return JsonResponse({'status': 'error', 'error': 'Missing message_id'}, status=400)
 		
-		msg = Message.objects.filter(id=message_id).filter(
-			models.Q(sender=request.user) | models.Q(receiver=request.user)
-		).first()
+		msg = Message.objects.filter(pk=message_id).only('id', 'sender', 'receiver').first()
 		
-		if not msg:
+		if not msg or request.user.pk not in (msg.sender_id, msg.receiver_id):
 			return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 		
 		msg.restore_for_user(request.user)
@@ -3451,8 +3624,11 @@ def student_restore_message_view(request):
 @role_required({User.Role.OSA_COORDINATOR})
 def faculty_mark_message_read_view(request, message_id: int):
 	"""OSA Coordinator: Mark a message as read."""
-	message_obj = get_object_or_404(Message, id=message_id, receiver=request.user)
-	message_obj.mark_read()
+	# Single UPDATE on the unread path; only probe for existence when nothing changed
+	received = Message.objects.filter(id=message_id, receiver=request.user)
+	updated = received.filter(read_at__isnull=True).update(read_at=timezone.now())
+	if not updated and not received.exists():
+		return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 	return JsonResponse({'status': 'ok'})
 
 
@@ -3463,19 +3639,16 @@ def faculty_delete_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		
 		if not message_id:
 			return JsonResponse({'status': 'error', 'error': 'Missing message_id'}, status=400)
 		
 		# Allow deletion of both sent and received messages
-		msg = Message.objects.filter(id=message_id).filter(
-			models.Q(sender=request.user) | models.Q(receiver=request.user)
-		).first()
+		msg = Message.objects.filter(pk=message_id).only('id', 'sender', 'receiver').first()
 		
-		if not msg:
+		if not msg or request.user.pk not in (msg.sender_id, msg.receiver_id):
 			return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 		
 		msg.delete_for_user(request.user)
@@ -3493,19 +3666,16 @@ def faculty_restore_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		
 		if not message_id:
 			return JsonResponse({'status': 'error', 'error': 'Missing message_id'}, status=400)
 		
 		# Allow restoration of both sent and received messages
-		msg = Message.objects.filter(id=message_id).filter(
-			models.Q(sender=request.user) | models.Q(receiver=request.user)
-		).first()
+		msg = Message.objects.filter(pk=message_id).only('id', 'sender', 'receiver').first()
 		
-		if not msg:
+		if not msg or request.user.pk not in (msg.sender_id, msg.receiver_id):
 			return JsonResponse({'status': 'error', 'error': 'Message not found'}, status=404)
 		
 		msg.restore_for_user(request.user)
@@ -3523,8 +3693,7 @@ def faculty_reply_message_view(request):
 		return JsonResponse({'status': 'error', 'error': 'POST required'}, status=405)
 	
 	try:
-		import json
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		message_id = data.get('message_id')
 		reply_text = data.get('reply', '').strip()
 		
@@ -3565,11 +3734,7 @@ def student_apology_view(request):
 		student=student
 	).exclude(
 		status=Violation.Status.RESOLVED
-	).order_by("-created_at")
-	
-	# Get existing apology letters for this student
-	existing_apologies = ApologyLetter.objects.filter(student=student).select_related("violation")
-	apology_by_violation = {a.violation_id: a for a in existing_apologies}
+	).select_related("violation_type").order_by("-created_at")
 	
 	if request.method == "POST":
 		violation_id = request.POST.get("violation_id")
@@ -3605,36 +3770,56 @@ def student_apology_view(request):
 		# Get the violation
 		violation = get_object_or_404(Violation, id=violation_id, student=student)
 		
-		# Check if already submitted and pending/approved
-		existing = apology_by_violation.get(violation.id)
+		# Store the drawn signature as an image file rather than a base64 blob on the row
+		signature_file = _content_file_from_data_url(signature_data, f"signature_{violation.id}")
+		
+		# Check if already submitted and pending/approved (only this violation's letter is needed;
+		# oldest first, matching the letter the status list shows)
+		existing = ApologyLetter.objects.filter(student=student, violation=violation).defer(
+			"signature_data", "formator_signature"
+		).order_by("submitted_at").first()
 		if existing and existing.status in [ApologyLetter.Status.PENDING, ApologyLetter.Status.APPROVED]:
 			messages.warning(request, f"You have already submitted an apology letter for this violation. Status: {existing.get_status_display()}")
 			return redirect("violations:student_apology")
 		
 		# Create or update apology letter
 		if existing and existing.status in [ApologyLetter.Status.REJECTED, ApologyLetter.Status.REVISION_NEEDED]:
-			# Update existing rejected/revision needed letter
+			# Update existing rejected/revision needed letter. Files go through save()
+			# so storage writes them; every other column is one targeted UPDATE.
+			file_fields = []
 			if apology_file:
 				existing.file = apology_file
-			existing.status = ApologyLetter.Status.PENDING
-			existing.submitted_at = timezone.now()
-			existing.verified_by = None
-			existing.verified_at = None
-			existing.remarks = ""
-			# Update letter form data
-			existing.letter_date = letter_date
-			existing.letter_campus = letter_campus
-			existing.letter_full_name = letter_full_name
-			existing.letter_suffix = letter_suffix
-			existing.letter_home_address = letter_home_address
-			existing.letter_program = letter_program
-			existing.letter_violations = letter_violations
-			existing.letter_printed_name = letter_printed_name
-			existing.signature_data = signature_data
-			existing.save()
+				file_fields.append("file")
+			if signature_file or existing.signature_image:
+				# The new signature replaces the old one, or clears it when none was drawn
+				# (as overwriting signature_data did); the old file is removed from storage
+				if existing.signature_image:
+					existing.signature_image.delete(save=False)
+				if signature_file:
+					existing.signature_image.save(signature_file.name, signature_file, save=False)
+				file_fields.append("signature_image")
+			if file_fields:
+				existing.save(update_fields=file_fields)
+			ApologyLetter.objects.filter(pk=existing.pk).update(
+				status=ApologyLetter.Status.PENDING,
+				submitted_at=timezone.now(),
+				verified_by=None,
+				verified_at=None,
+				remarks="",
+				letter_date=letter_date,
+				letter_campus=letter_campus,
+				letter_full_name=letter_full_name,
+				letter_suffix=letter_suffix,
+				letter_home_address=letter_home_address,
+				letter_program=letter_program,
+				letter_violations=letter_violations,
+				letter_printed_name=letter_printed_name,
+				signature_data="",
+			)
+			# update() skips post_save, so clear the cached status counts here
+			cache.delete(APOLOGY_STATUS_COUNTS_CACHE_KEY)
 			
 			# Log activity for resubmitted apology
-			from .models import ActivityLog
 			ActivityLog.log_activity(
 				user=request.user,
 				action_type=ActivityLog.ActionType.APOLOGY_RESUBMITTED,
@@ -3659,14 +3844,14 @@ def student_apology_view(request):
 				letter_program=letter_program,
 				letter_violations=letter_violations,
 				letter_printed_name=letter_printed_name,
-				signature_data=signature_data
 			)
 			if apology_file:
 				apology_letter.file = apology_file
+			if signature_file:
+				apology_letter.signature_image.save(signature_file.name, signature_file, save=False)
 			apology_letter.save()
 			
 			# Log activity for new apology submission
-			from .models import ActivityLog
 			ActivityLog.log_activity(
 				user=request.user,
 				action_type=ActivityLog.ActionType.APOLOGY_SUBMITTED,
@@ -3680,6 +3865,14 @@ def student_apology_view(request):
 		
 		return redirect("violations:student_apology")
 	
+	# Existing apology letters keyed by violation, limited to the violations listed above.
+	# in_bulk(field_name="violation_id") isn't usable: a violation can have several letters.
+	# The status list never shows the letter body or signatures, so leave those columns behind
+	existing_apologies = ApologyLetter.objects.filter(student=student).exclude(
+		violation__status=Violation.Status.RESOLVED
+	).defer("signature_data", "formator_signature", "letter_home_address", "letter_violations")
+	apology_by_violation = {a.violation_id: a for a in existing_apologies}
+	
 	# Prepare context with violation apology status
 	violations_with_status = []
 	for v in violations_needing_apology:
@@ -3691,7 +3884,10 @@ def student_apology_view(request):
 		})
 	
 	# Also include resolved violations that might have apologies
-	all_apologies = ApologyLetter.objects.filter(student=student).select_related("violation").order_by("-submitted_at")
+	# The history modal renders the letter body and student signature, so only the formator's is skipped
+	all_apologies = ApologyLetter.objects.filter(student=student).select_related(
+		"violation", "violation__violation_type", "verified_by"
+	).defer("formator_signature").order_by("-submitted_at")
 	
 	ctx = {
 		"student": student,
@@ -3718,7 +3914,7 @@ def staff_schedule_meeting_view(request, alert_id):
 	
 	# Parse JSON data from request body
 	try:
-		data = json.loads(request.body)
+		data = _json_loads(request.body)
 		scheduled_meeting_str = data.get("scheduled_meeting")
 		meeting_deadline_str = data.get("meeting_deadline")
 		meeting_notes = data.get("meeting_notes", "")
@@ -3741,59 +3937,49 @@ def staff_schedule_meeting_view(request, alert_id):
 		if meeting_deadline <= scheduled_meeting:
 			return JsonResponse({"error": "Deadline must be after meeting time"}, status=400)
 		
-		alert.scheduled_meeting = scheduled_meeting
-		alert.meeting_deadline = meeting_deadline
-		alert.meeting_notes = meeting_notes
-		alert.meeting_status = StaffAlert.MeetingStatus.SCHEDULED
-		alert.meeting_status_updated_at = timezone.now()
-		alert.save()
+		# Values shared by both notices, computed once
+		meeting_str = scheduled_meeting.strftime('%B %d, %Y at %I:%M %p')
+		deadline_str = meeting_deadline.strftime('%B %d, %Y at %I:%M %p')
+		student_name = alert.student.user.get_full_name() or alert.student.user.username
+		staff_name = request.user.get_full_name() or request.user.username
+		notes_line = f"- Additional Notes: {meeting_notes}" if meeting_notes else ""
 		
-		# Send notification to OSA Coordinator
-		faculty_users = User.objects.filter(role=User.Role.OSA_COORDINATOR)
-		for faculty in faculty_users:
-			Message.objects.create(
-				sender=request.user,
-				receiver=faculty,
-				content=f"""URGENT: Meeting Scheduled with Student
+		# Same notice for every coordinator: format it once, then insert all messages in one batch
+		faculty_body = f"""URGENT: Meeting Scheduled with Student
 
 A mandatory meeting has been scheduled regarding a student who has reached the violation threshold.
 
 Student Details:
 - Student ID: {alert.student.student_id}
-- Name: {alert.student.user.get_full_name() or alert.student.user.username}
+- Name: {student_name}
 - Effective Major Violations: {alert.effective_major_count}
 
 Meeting Details:
-- Date & Time: {scheduled_meeting.strftime('%B %d, %Y at %I:%M %p')}
-- Deadline: {meeting_deadline.strftime('%B %d, %Y at %I:%M %p')}
+- Date & Time: {meeting_str}
+- Deadline: {deadline_str}
 - Location: OSA Office
 - Status: SCHEDULED
 - Purpose: Review violation record and determine next steps
-{f"- Additional Notes: {meeting_notes}" if meeting_notes else ""}
+{notes_line}
 
 ⚠️ Note: Meeting will automatically expire if student doesn't attend by the deadline.
 
 Please be prepared to discuss the student's violation history and appropriate disciplinary actions.
 
-This meeting was scheduled by: {request.user.get_full_name() or request.user.username}
+This meeting was scheduled by: {staff_name}
 """.strip()
-			)
 		
-		# Send notification to the student
-		Message.objects.create(
-			sender=request.user,
-			receiver=alert.student.user,
-			content=f"""MANDATORY MEETING NOTICE
+		student_body = f"""MANDATORY MEETING NOTICE
 
 You have been scheduled for a mandatory meeting with the OSA Coordinator due to reaching the violation threshold.
 
 Meeting Details:
-- Date & Time: {scheduled_meeting.strftime('%B %d, %Y at %I:%M %p')}
-- ⚠️ DEADLINE: {meeting_deadline.strftime('%B %d, %Y at %I:%M %p')}
+- Date & Time: {meeting_str}
+- ⚠️ DEADLINE: {deadline_str}
 - Location: OSA Office
 - Status: SCHEDULED
 - Purpose: Review your violation record and discuss next steps
-{f"- Additional Notes: {meeting_notes}" if meeting_notes else ""}
+{notes_line}
 
 Important Notes:
 - This meeting is mandatory and your attendance is required
@@ -3812,9 +3998,29 @@ For questions, contact the OSA Office.
 
 Regards,
 OSA Staff
-{request.user.get_full_name() or request.user.username}
+{staff_name}
 """.strip()
-		)
+		
+		# Notify every OSA Coordinator and the student
+		faculty_ids = User.objects.filter(role=User.Role.OSA_COORDINATOR).values_list('id', flat=True)
+		notifications = [
+			Message(sender=request.user, receiver_id=faculty_id, content=faculty_body)
+			for faculty_id in faculty_ids
+		]
+		notifications.append(Message(sender=request.user, receiver=alert.student.user, content=student_body))
+		
+		with transaction.atomic():
+			# Conditional UPDATE: a concurrent resolve makes this a no-op instead of overwriting it
+			updated = StaffAlert.objects.filter(id=alert.id, resolved=False).update(
+				scheduled_meeting=scheduled_meeting,
+				meeting_deadline=meeting_deadline,
+				meeting_notes=meeting_notes,
+				meeting_status=StaffAlert.MeetingStatus.SCHEDULED,
+				meeting_status_updated_at=timezone.now(),
+			)
+			if not updated:
+				return JsonResponse({"error": "Alert not found or already resolved"}, status=404)
+			Message.objects.bulk_create(notifications, batch_size=500)
 		
 		return JsonResponse({"status": "success", "message": "Meeting scheduled successfully. Notifications sent to student and OSA Coordinator."})
 	except Exception as e:
@@ -3842,30 +4048,34 @@ def staff_mark_meeting_met_view(request, alert_id):
 		alert.meeting_status_updated_at = timezone.now()
 		alert.save()
 		
-		# Send notification to OSA Coordinator
-		faculty_users = User.objects.filter(role=User.Role.OSA_COORDINATOR)
-		for faculty in faculty_users:
-			if faculty != request.user:  # Don't notify yourself
-				Message.objects.create(
-					sender=request.user,
-					receiver=faculty,
-					content=f"""MEETING STATUS UPDATE: Completed
+		# Values shared by both notices, computed once
+		meeting_str = alert.scheduled_meeting.strftime('%B %d, %Y at %I:%M %p') if alert.scheduled_meeting else 'N/A'
+		student_name = alert.student.user.get_full_name() or alert.student.user.username
+		staff_name = request.user.get_full_name() or request.user.username
+		
+		# Send notification to OSA Coordinator (one formatted body, one batch insert)
+		faculty_body = f"""MEETING STATUS UPDATE: Completed
 
 The scheduled meeting has been marked as COMPLETED.
 
 Student Details:
 - Student ID: {alert.student.student_id}
-- Name: {alert.student.user.get_full_name() or alert.student.user.username}
+- Name: {student_name}
 - Effective Major Violations: {alert.effective_major_count}
 
 Meeting Details:
-- Original Scheduled Time: {alert.scheduled_meeting.strftime('%B %d, %Y at %I:%M %p') if alert.scheduled_meeting else 'N/A'}
+- Original Scheduled Time: {meeting_str}
 - Status: MET/COMPLETED
-- Marked by: {request.user.get_full_name() or request.user.username}
+- Marked by: {staff_name}
 
 Please follow up with any necessary disciplinary actions or documentation.
 """.strip()
-				)
+		faculty_ids = User.objects.filter(role=User.Role.OSA_COORDINATOR).values_list('id', flat=True)
+		Message.objects.bulk_create([
+			Message(sender=request.user, receiver_id=faculty_id, content=faculty_body)
+			for faculty_id in faculty_ids
+			if faculty_id != request.user.pk  # Don't notify yourself
+		])
 		
 		# Send notification to the student
 		Message.objects.create(
@@ -3876,7 +4086,7 @@ Please follow up with any necessary disciplinary actions or documentation.
 Your mandatory meeting with the OSA Coordinator has been marked as COMPLETED.
 
 Meeting Details:
-- Scheduled Time: {alert.scheduled_meeting.strftime('%B %d, %Y at %I:%M %p') if alert.scheduled_meeting else 'N/A'}
+- Scheduled Time: {meeting_str}
 - Status: MET/COMPLETED
 
 Thank you for attending the meeting. Please follow any instructions or action items discussed during the meeting.
@@ -3900,13 +4110,13 @@ def staff_resolve_alert_view(request, alert_id):
 		return JsonResponse({"error": "Method not allowed"}, status=405)
 	
 	try:
-		alert = StaffAlert.objects.get(id=alert_id, resolved=False)
-		alert.resolved = True
-		alert.resolved_at = timezone.now()
-		alert.save()
+		# Single conditional UPDATE: only one of several concurrent clicks can resolve the alert
+		updated = StaffAlert.objects.filter(id=alert_id, resolved=False).update(
+			resolved=True, resolved_at=timezone.now()
+		)
+		if not updated:
+			return JsonResponse({"error": "Alert not found or already resolved"}, status=404)
 		return JsonResponse({"status": "success", "message": "Alert resolved successfully"})
-	except StaffAlert.DoesNotExist:
-		return JsonResponse({"error": "Alert not found"}, status=404)
 	except Exception as e:
 		return JsonResponse({"error": str(e)}, status=400)
 
@@ -3964,7 +4174,9 @@ def staff_permanent_delete_alert_view(request, alert_id):
 ############################################
 
 # Valid guard codes - simple authentication
-VALID_GUARD_CODES = ['Guard1', 'Guard2', 'Guard3']
+VALID_GUARD_CODES = frozenset({'Guard1', 'Guard2', 'Guard3'})
+# Case-insensitive lookup: lowercased code -> canonical code stored in the session
+_GUARD_CODES_BY_LOWER = {code.lower(): code for code in VALID_GUARD_CODES}
 
 
 def guard_login_view(request):
@@ -3979,12 +4191,12 @@ def guard_login_view(request):
 	if request.method == 'POST':
 		guard_code = request.POST.get('guard_code', '').strip()
 		
-		# Normalize the input (capitalize first letter of each word)
-		normalized_code = guard_code.title()
+		# Match case-insensitively and store the canonical spelling
+		canonical_code = _GUARD_CODES_BY_LOWER.get(guard_code.lower())
 		
-		if normalized_code in VALID_GUARD_CODES:
+		if canonical_code:
 			# Set session for guard
-			request.session['guard_code'] = normalized_code
+			request.session['guard_code'] = canonical_code
 			request.session['guard_login_time'] = timezone.now().isoformat()
 			return redirect('violations:guard_dashboard')
 		else:
@@ -4015,6 +4227,20 @@ def guard_required(view_func):
 	return wrapper
 
 
+def _cached_violation_types():
+	"""Violation type catalog ordered by category and name.
+
+	Cached as reference data. The cache is per process, so the ViolationType signals in
+	signals.py only clear this worker's copy; the short TTL bounds how long other workers
+	serve a stale list, and lookups by ID fall back to the database on a miss.
+	"""
+	return cache.get_or_set(
+		VIOLATION_TYPES_CACHE_KEY,
+		lambda: list(ViolationType.objects.all().order_by('category', 'name')),
+		300,
+	)
+
+
 @guard_required
 def guard_dashboard_view(request):
 	"""Guard dashboard - view-only access to student info and violations."""
@@ -4023,62 +4249,53 @@ def guard_dashboard_view(request):
 	# Get statistics for this specific guard
 	total_students = StudentModel.objects.count()
 	
-	# Count violations reported by this specific guard
-	my_reports = Violation.objects.filter(reported_by_guard=guard_code)
-	my_reports_count = my_reports.count()
-	
-	# Today's incidents reported by this guard
+	# Report counts for this guard in a single pass over their violations:
+	# total, today's incidents, pending (not yet resolved) and resolved
 	today = timezone.now().date()
-	today_incidents = Violation.objects.filter(
-		reported_by_guard=guard_code,
-		created_at__date=today
-	).count()
-	
-	# Pending reports (not yet resolved) for this guard
-	pending_reports = Violation.objects.filter(
-		reported_by_guard=guard_code,
-		status__in=[Violation.Status.REPORTED, Violation.Status.UNDER_REVIEW]
-	).count()
-	
-	# Incident reports issued by this guard (last 10)
-	my_incident_reports = Violation.objects.filter(
-		reported_by_guard=guard_code
-	).select_related(
-		'student', 'student__user', 'violation_type'
-	).order_by('-created_at')[:10]
+	report_stats = Violation.objects.filter(reported_by_guard=guard_code).aggregate(
+		total=Count('id'),
+		today=Count('id', filter=Q(created_at__date=today)),
+		pending=Count('id', filter=Q(status__in=[Violation.Status.REPORTED, Violation.Status.UNDER_REVIEW])),
+		resolved=Count('id', filter=Q(status=Violation.Status.RESOLVED)),
+	)
+	my_reports_count = report_stats['total']
+	today_incidents = report_stats['today']
+	pending_reports = report_stats['pending']
+	resolved_reports = report_stats['resolved']
+	
+	# Only the columns the dashboard tables render
+	report_columns = (
+		'id', 'created_at', 'incident_at', 'type', 'location', 'status',
+		'student', 'student__student_id', 'student__program', 'student__year_level',
+		'student__user', 'student__user__first_name', 'student__user__last_name',
+		'violation_type', 'violation_type__name',
+	)
 	
-	# Full activity log - all violations reported by this guard
-	activity_log = Violation.objects.filter(
-		reported_by_guard=guard_code
-	).select_related(
-		'student', 'student__user', 'violation_type'
-	).order_by('-created_at')[:50]
+	# Activity log - latest 50 violations reported by this guard, fetched once;
+	# the recent incident reports table is just its first 10 rows
+	activity_log = list(
+		Violation.objects.filter(
+			reported_by_guard=guard_code
+		).select_related(
+			'student', 'student__user', 'violation_type'
+		).only(*report_columns).order_by('-created_at')[:50]
+	)
+	my_incident_reports = activity_log[:10]
 	
 	activity_log_count = my_reports_count  # Total count of all reports
 	
-	# Count resolved reports
-	resolved_reports = Violation.objects.filter(
-		reported_by_guard=guard_code,
-		status=Violation.Status.RESOLVED
-	).count()
-	
 	# Student lookup
 	search_id = request.GET.get('student_id', '').strip()
 	searched_student = None
 	
 	if search_id:
+		# violation_count is a stored column, so no extra count query is needed
 		searched_student = StudentModel.objects.select_related('user').filter(
 			student_id__iexact=search_id
 		).first()
-		
-		if searched_student:
-			# Add violation count
-			searched_student.violation_count = Violation.objects.filter(
-				student=searched_student
-			).count()
 	
-	# Get all violation types for the incident report form
-	violation_types = ViolationType.objects.all().order_by('category', 'name')
+	# Get all violation types for the incident report form (reference data, cached)
+	violation_types = _cached_violation_types()
 	
 	ctx = {
 		'guard_code': guard_code,
@@ -4099,6 +4316,18 @@ def guard_dashboard_view(request):
 	return render(request, 'violations/guard/dashboard.html', ctx)
 
 
+def _find_user_by_username_or_email(username, email=''):
+	"""Return the user with this username, else one with this email (if given), in one query."""
+	q = Q(username=username)
+	if email:
+		q |= Q(email__iexact=email)
+	# Email uniqueness is case-sensitive, so several rows may match email__iexact;
+	# rank the username match first, then the oldest email match (as .first() did)
+	return User.objects.filter(q).annotate(
+		username_match=Case(When(username=username, then=0), default=1, output_field=IntegerField()),
+	).order_by('username_match', 'pk').first()
+
+
 @guard_required
 def guard_report_incident_view(request):
 	"""Guard can report an incident/violation they caught."""
@@ -4131,8 +4360,8 @@ def guard_report_incident_view(request):
 					'error': 'Student ID must be exactly 8 digits.'
 				})
 			
-			# Check if student exists by student_id
-			student = StudentModel.objects.filter(student_id__iexact=student_id).first()
+			# Check if student exists by student_id (user is needed for the success message)
+			student = StudentModel.objects.select_related('user').filter(student_id__iexact=student_id).first()
 			student_created = False
 			
 			if not student:
@@ -4158,10 +4387,6 @@ def guard_report_incident_view(request):
 					})
 				
 				# Create a User account for the new student
-				from django.contrib.auth import get_user_model
-				from django.db import transaction, IntegrityError
-				User = get_user_model()
-				
 				# Generate a username based on student_id
 				username = student_id.replace('-', '').lower()
 				
@@ -4173,60 +4398,45 @@ def guard_report_incident_view(request):
 					with transaction.atomic():
 						# Double-check student doesn't exist (race condition protection)
 						student = StudentModel.objects.filter(student_id__iexact=student_id).first()
-						if student:
-							# Student was created between our checks - use it
-							pass
-						else:
+						if not student:
+							profile_defaults = _build_student_kwargs(
+								student_id, program, _safe_year(year_level), suffix=suffix, contact_number=contact_number,
+								guardian_name=guardian_name, guardian_contact=guardian_contact,
+							)
+							
 							# Check if user already exists with this username OR email
-							existing_user = User.objects.filter(username=username).first()
-							if not existing_user and email:
-								# Also check by email if provided
-								existing_user = User.objects.filter(email__iexact=email).first()
+							existing_user = _find_user_by_username_or_email(username, email)
 							
 							if existing_user:
-								# Check if a Student profile already exists for this user
-								existing_student = StudentModel.objects.filter(user=existing_user).first()
-								if existing_student:
-									# Use existing student profile
-									student = existing_student
-								else:
-									# User exists but no student profile - create one
-									try:
-										year_level_int = int(year_level)
-									except (ValueError, TypeError):
-										year_level_int = 1
-									
-									student = StudentModel.objects.create(
-										user=existing_user,
-										student_id=student_id,
-										suffix=suffix,
-										program=program,
-										year_level=year_level_int,
-										year_level_assigned_at=timezone.now(),
-										department=program,
-										contact_number=contact_number,
-										guardian_name=guardian_name,
-										guardian_contact=guardian_contact,
-										enrollment_status='Active'
-									)
-									student_created = True
+								# Use the user's Student profile, creating one if it has none
+								student, student_created = StudentModel.objects.get_or_create(
+									user=existing_user, defaults=profile_defaults
+								)
 							else:
 								# Create new user and student profile
 								full_last_name = f"{last_name} {suffix}".strip() if suffix else last_name
 								
-								# Generate unique email if not provided or if it exists
+								# Generate unique email if not provided or if it exists.
+								# Fetch every taken candidate in one query, then pick a free suffix in Python.
+								name_part, _, domain_part = base_email.partition('@')
+								taken_emails = {
+									e.lower() for e in User.objects.filter(
+										email__istartswith=name_part
+									).values_list('email', flat=True)
+								}
 								final_email = base_email
 								email_counter = 1
-								while User.objects.filter(email__iexact=final_email).exists():
-									name_part = base_email.split('@')[0]
-									domain_part = base_email.split('@')[1]
+								while final_email.lower() in taken_emails:
 									final_email = f"{name_part}{email_counter}@{domain_part}"
 									email_counter += 1
 								
 								# Also ensure username is unique
+								taken_usernames = set(
+									User.objects.filter(username__startswith=username).values_list('username', flat=True)
+								)
 								final_username = username
 								username_counter = 1
-								while User.objects.filter(username=final_username).exists():
+								while final_username in taken_usernames:
 									final_username = f"{username}_{username_counter}"
 									username_counter += 1
 								
@@ -4240,57 +4450,22 @@ def guard_report_incident_view(request):
 								)
 								
 								# NOTE: A signal in signals.py auto-creates a Student profile
-								# when a User with role='student' is created. We need to fetch
-								# and update that profile instead of creating a new one.
-								try:
-									year_level_int = int(year_level)
-								except (ValueError, TypeError):
-									year_level_int = 1
-								
-								# Get the auto-created student profile and update it
-								student = StudentModel.objects.filter(user=user).first()
-								if student:
-									# Update the auto-created profile with proper data
-									student.student_id = student_id
-									student.suffix = suffix
-									student.program = program
-									student.year_level = year_level_int
-									student.year_level_assigned_at = timezone.now()
-									student.department = program
-									student.contact_number = contact_number
-									student.guardian_name = guardian_name
-									student.guardian_contact = guardian_contact
-									student.enrollment_status = 'Active'
-									student.save()
-								else:
-									# Signal didn't create one, create manually
-									student = StudentModel.objects.create(
-										user=user,
-										student_id=student_id,
-										suffix=suffix,
-										program=program,
-										year_level=year_level_int,
-										year_level_assigned_at=timezone.now(),
-										department=program,
-										contact_number=contact_number,
-										guardian_name=guardian_name,
-										guardian_contact=guardian_contact,
-										enrollment_status='Active'
-									)
+								# when a User with role='student' is created. Fill that profile in
+								# (or create it if the signal didn't) in one call.
+								student, _ = StudentModel.objects.update_or_create(
+									user=user, defaults=profile_defaults
+								)
 								student_created = True
 				except IntegrityError as e:
 					# If we still get an integrity error, try to fetch the existing student
 					student = StudentModel.objects.filter(student_id__iexact=student_id).first()
 					if not student:
-						# Try to find by username
-						existing_user = User.objects.filter(username=username).first()
-						if not existing_user and email:
-							existing_user = User.objects.filter(email__iexact=email).first()
+						# Try to find by username or email
+						existing_user = _find_user_by_username_or_email(username, email)
 						if existing_user:
 							student = StudentModel.objects.filter(user=existing_user).first()
 					
 					if not student:
-						import traceback
 						print(f"IntegrityError in guard report: {e}")
 						print(traceback.format_exc())
 						return JsonResponse({
@@ -4298,15 +4473,20 @@ def guard_report_incident_view(request):
 							'error': f'Database error: {str(e)}. The student may already exist with different details.'
 						})
 			
-			# Get violation type if provided
+			# Get violation type if provided: from the cached catalog, or the database when
+			# this worker's copy predates the type
 			violation_type = None
 			if violation_type_id:
-				try:
-					violation_type = ViolationType.objects.get(id=violation_type_id)
+				violation_type = {str(vt.id): vt for vt in _cached_violation_types()}.get(violation_type_id)
+				if violation_type is None:
+					violation_type = ViolationType.objects.filter(id=violation_type_id).first()
+				if violation_type:
 					# Use the category from the violation type as severity
 					severity = violation_type.category
-				except ViolationType.DoesNotExist:
-					pass
+			
+			# Decode the proof image (if provided) up front so the file is stored as
+			# part of the INSERT rather than by a second UPDATE afterwards
+			proof_file = _content_file_from_data_url(proof_image, f"proof_{student.student_id}")
 			
 			# Create the violation/incident report
 			violation = Violation.objects.create(
@@ -4317,32 +4497,20 @@ def guard_report_incident_view(request):
 				type=severity,
 				location=location,
 				description=description,
+				evidence_file=proof_file,
 				status=Violation.Status.REPORTED,
 			)
 			
-			# Save proof image if provided
-			if proof_image and proof_image.startswith('data:image'):
-				import base64
-				from django.core.files.base import ContentFile
-				
-				# Extract the base64 data
-				format_data, imgstr = proof_image.split(';base64,')
-				ext = format_data.split('/')[-1]
-				
-				# Create file from base64
-				image_data = base64.b64decode(imgstr)
-				file_name = f"proof_{violation.id}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
-				violation.evidence_file.save(file_name, ContentFile(image_data), save=True)
+			# One display name for the message and the activity log
+			student_name = student.display_name
 			
 			# Build success message
 			if student_created:
 				message = f'Incident report #{violation.id} submitted! New student "{first_name} {last_name}" ({student_id}) was automatically registered.'
 			else:
-				message = f'Incident report #{violation.id} submitted successfully for {student.user.get_full_name() or student_id}!'
+				message = f'Incident report #{violation.id} submitted successfully for {student_name}!'
 			
 			# Log the guard activity
-			from .models import ActivityLog
-			student_name = student.user.get_full_name() or student_id
 			ActivityLog.log_activity(
 				action_type=ActivityLog.ActionType.INCIDENT_REPORTED,
 				description=f"Reported incident for {student_name}: {description[:100]}..." if len(description) > 100 else f"Reported incident for {student_name}: {description}",
@@ -4360,7 +4528,6 @@ def guard_report_incident_view(request):
 				'student_created': student_created,
 			})
 		except Exception as e:
-			import traceback
 			print(f"Error in guard_report_incident_view: {e}")
 			print(traceback.format_exc())
 			return JsonResponse({
@@ -4372,18 +4539,22 @@ def guard_report_incident_view(request):
 	check_student_id = request.GET.get('check_student', '').strip()
 	if check_student_id:
 		# AJAX call to check if student exists
-		student = StudentModel.objects.filter(student_id__iexact=check_student_id).first()
+		student = StudentModel.objects.select_related('user').filter(student_id__iexact=check_student_id).first()
 		if student:
 			return JsonResponse({
 				'exists': True,
-				'student_name': student.user.get_full_name() or student.student_id,
+				'student_name': student.display_name,
 				'program': student.program,
 				'year_level': student.year_level,
 			})
 		else:
 			return JsonResponse({'exists': False})
 	
-	violation_types = list(ViolationType.objects.values('id', 'name', 'severity', 'category'))
+	# ViolationType has no severity column; its category is what reports use as severity
+	violation_types = [
+		{'id': vt.id, 'name': vt.name, 'severity': vt.category, 'category': vt.category}
+		for vt in _cached_violation_types()
+	]
 	return JsonResponse({'violation_types': violation_types})
 
 
@@ -4391,7 +4562,9 @@ def guard_report_incident_view(request):
 # Student Formator Portal
 ############################################
 
-VALID_FORMATOR_CODES = ['FormatorHead']
+VALID_FORMATOR_CODES = frozenset({'FormatorHead'})
+# Case-insensitive lookup: lowercased code -> canonical code stored in the session
+_FORMATOR_CODES_BY_LOWER = {code.lower(): code for code in VALID_FORMATOR_CODES}
 
 
 def formator_login_view(request):
@@ -4402,13 +4575,12 @@ def formator_login_view(request):
 	if request.method == 'POST':
 		formator_code = request.POST.get('formator_code', '').strip()
 		
-		# Check if valid formator code (case-insensitive match)
-		normalized_code = formator_code.title().replace(' ', '')
+		# Check if valid formator code (case- and space-insensitive match)
+		canonical_code = _FORMATOR_CODES_BY_LOWER.get(formator_code.replace(' ', '').lower())
 		
-		# Check against valid codes
-		if normalized_code in VALID_FORMATOR_CODES or formator_code.lower() == 'formatorhead':
+		if canonical_code:
 			# Set session for formator
-			request.session['formator_code'] = 'FormatorHead'
+			request.session['formator_code'] = canonical_code
 			request.session['formator_login_time'] = timezone.now().isoformat()
 			return redirect('violations:formator_dashboard')
 		else:
@@ -4439,6 +4611,35 @@ def formator_required(view_func):
 	return wrapper
 
 
+def _formator_letter_lists():
+	"""Return the formator's (pending, signed, rejected) letter lists from a single query.
+
+	Pending letters are all returned, newest sent first; the signed and rejected logs
+	keep their latest 20 and 10 by signing time. A row number per status applies
+	those limits inside the query.
+	"""
+	sort_key = Case(
+		When(formator_status='pending', then=F('sent_to_formator_at')),
+		default=F('formator_signed_at'),
+	)
+	letters = ApologyLetter.objects.filter(
+		formator_status__in=['pending', 'signed', 'rejected']
+	).select_related(
+		'student', 'student__user', 'violation', 'sent_to_formator_by'
+	).defer('signature_data', 'formator_signature').annotate(
+		status_rank=Window(RowNumber(), partition_by=[F('formator_status')], order_by=sort_key.desc()),
+	).filter(
+		Q(formator_status='pending')
+		| Q(formator_status='signed', status_rank__lte=20)
+		| Q(formator_status='rejected', status_rank__lte=10)
+	).order_by('formator_status', 'status_rank')
+	
+	by_status = {'pending': [], 'signed': [], 'rejected': []}
+	for letter in letters:
+		by_status[letter.formator_status].append(letter)
+	return by_status['pending'], by_status['signed'], by_status['rejected']
+
+
 @formator_required
 def formator_dashboard_view(request):
 	"""Formator dashboard - view student info, violations, and alerts."""
@@ -4450,52 +4651,57 @@ def formator_dashboard_view(request):
 		status__in=[Violation.Status.REPORTED, Violation.Status.UNDER_REVIEW]
 	).count()
 	
-	# Pending apology letters (general count)
-	from .models import ApologyLetter
-	pending_apologies = ApologyLetter.objects.filter(status='pending').count()
-	
-	# Letters pending formator review
-	pending_formator_letters = ApologyLetter.objects.filter(
-		formator_status='pending'
-	).select_related('student', 'student__user', 'violation').order_by('-sent_to_formator_at')
-	
-	# Signed letters log (documents formator has signed)
-	signed_letters = ApologyLetter.objects.filter(
-		formator_status='signed'
-	).select_related('student', 'student__user', 'violation').order_by('-formator_signed_at')[:20]
+	# Pending apology letters (general count, shared with the staff apology list)
+	pending_apologies = _apology_status_counts()['pending']
 	
-	# Rejected letters log
-	rejected_letters = ApologyLetter.objects.filter(
-		formator_status='rejected'
-	).select_related('student', 'student__user', 'violation').order_by('-formator_signed_at')[:10]
+	# Pending review, signed log (latest 20) and rejected log (latest 10) in one query.
+	# Cached for 30 seconds per worker; ApologyLetter signals clear this worker's copy
+	# on change, and the TTL bounds how stale the other workers' copies can get.
+	pending_formator_letters, signed_letters, rejected_letters = cache.get_or_set(
+		FORMATOR_LETTERS_CACHE_KEY, _formator_letter_lists, 30,
+	)
 	
 	# Active alerts
 	active_alerts = StaffAlert.objects.filter(resolved=False).count()
 	
-	# Recent violations (last 10)
-	recent_violations = Violation.objects.select_related(
-		'student', 'student__user', 'violation_type'
-	).order_by('-created_at')[:10]
+	# Recent violations (last 10), only the columns the table renders.
+	# Cached for 30 seconds per worker, like the letter lists above.
+	recent_violations = cache.get_or_set(
+		FORMATOR_RECENT_VIOLATIONS_CACHE_KEY,
+		lambda: list(Violation.objects.select_related(
+			'student', 'student__user', 'violation_type'
+		).only(
+			'id', 'incident_at', 'type', 'status',
+			'student__student_id', 'student__user__first_name', 'student__user__last_name',
+			'violation_type__name',
+		).order_by('-created_at')[:10]),
+		30,
+	)
 	
-	# Students with violations (sorted by count, top 10)
-	students_with_violations = StudentModel.objects.annotate(
-		violation_count=Count('violations')
-	).filter(violation_count__gt=0).order_by('-violation_count')[:10]
+	# Students with violations (sorted by the stored violation_count, top 10).
+	# Cached for 30 seconds per worker, like the lists above.
+	students_with_violations = cache.get_or_set(
+		FORMATOR_TOP_STUDENTS_CACHE_KEY,
+		lambda: list(
+			StudentModel.objects.select_related('user').only(
+				'id', 'student_id', 'program', 'year_level', 'violation_count',
+				'user__first_name', 'user__last_name',
+			).filter(
+				violation_count__gt=0
+			).order_by('-violation_count')[:10]
+		),
+		30,
+	)
 	
 	# Student lookup
 	search_id = request.GET.get('student_id', '').strip()
 	searched_student = None
 	
 	if search_id:
+		# violation_count is a stored column, so no extra count query is needed
 		searched_student = StudentModel.objects.select_related('user').filter(
 			student_id__iexact=search_id
 		).first()
-		
-		if searched_student:
-			# Add violation count
-			searched_student.violation_count = Violation.objects.filter(
-				student=searched_student
-			).count()
 	
 	ctx = {
 		'formator_code': formator_code,
@@ -4504,9 +4710,9 @@ def formator_dashboard_view(request):
 		'active_violations': active_violations,
 		'pending_apologies': pending_apologies,
 		'pending_formator_letters': pending_formator_letters,
-		'pending_formator_count': pending_formator_letters.count(),
+		'pending_formator_count': len(pending_formator_letters),
 		'signed_letters': signed_letters,
-		'signed_letters_count': signed_letters.count(),
+		'signed_letters_count': len(signed_letters),
 		'rejected_letters': rejected_letters,
 		'active_alerts': active_alerts,
 		'recent_violations': recent_violations,
@@ -4547,9 +4753,8 @@ def formator_verify_letter_view(request, letter_id):
 			letter.save()
 			
 			# Log formator activity
-			from .models import ActivityLog
 			formator_code = request.session.get('formator_code', 'Formator')
-			student_name = letter.student.user.get_full_name() or letter.student.student_id
+			student_name = letter.student.display_name
 			ActivityLog.log_activity(
 				action_type=ActivityLog.ActionType.LETTER_SIGNED,
 				description=f"Signed apology letter from {student_name} for violation #{letter.violation.id}",
@@ -4570,9 +4775,8 @@ def formator_verify_letter_view(request, letter_id):
 			letter.save()
 			
 			# Log formator rejection activity
-			from .models import ActivityLog
 			formator_code = request.session.get('formator_code', 'Formator')
-			student_name = letter.student.user.get_full_name() or letter.student.student_id
+			student_name = letter.student.display_name
 			ActivityLog.log_activity(
 				action_type=ActivityLog.ActionType.LETTER_REJECTED_FORMATOR,
 				description=f"Rejected apology letter from {student_name}. Remarks: {formator_remarks}",